@@ -300,6 +300,13 @@ pub struct CallToolRequest {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct CallToolResult {
     pub content: Vec<Content>,
+    /// Machine-readable copy of a JSON result, so clients need not parse the text
+    #[serde(
+        rename = "structuredContent",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub structured_content: Option<Value>,
     #[serde(default)]
     pub is_error: bool,
 }
@@ -309,6 +316,7 @@ impl CallToolResult {
     pub fn text(text: impl Into<String>) -> Self {
         Self {
             content: vec![Content::text(text)],
+            structured_content: None,
             is_error: false,
         }
     }
@@ -317,6 +325,7 @@ impl CallToolResult {
     pub fn error(message: impl Into<String>) -> Self {
         Self {
             content: vec![Content::text(message)],
+            structured_content: None,
             is_error: true,
         }
     }
@@ -327,6 +336,7 @@ impl CallToolResult {
             content: vec![Content::text(
                 serde_json::to_string_pretty(&value).unwrap_or_default(),
             )],
+            structured_content: Some(value),
             is_error: false,
         }
     }
@@ -457,5 +467,16 @@ mod tests {
         let result = CallToolResult::text("Success");
         assert!(!result.is_error);
         assert_eq!(result.content.len(), 1);
+        assert!(result.structured_content.is_none());
+    }
+
+    #[test]
+    fn test_json_tool_result_structured_content() {
+        let result = CallToolResult::json(serde_json::json!({"id": "abc123=="}));
+        let value = serde_json::to_value(&result).unwrap();
+        assert_eq!(value["structuredContent"]["id"], "abc123==");
+
+        let text = serde_json::to_value(CallToolResult::text("Success")).unwrap();
+        assert!(text.get("structuredContent").is_none());
     }
 }
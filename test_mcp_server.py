@@ -5,30 +5,172 @@ Tests all tools, benchmarks performance, and generates assessment report
 """
 
 import asyncio
+import itertools
 import json
+import os
+import re
+import socket
+import stat
 import subprocess
 import time
 import statistics
+import traceback
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import sys
 
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib encoder when orjson is unavailable
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def json_loads(data: Any) -> Any:
+        # json.loads does not accept memoryview frames
+        return json.loads(bytes(data))
+
+try:
+    import numpy as np
+except ImportError:  # Benchmark stats fall back to the statistics module
+    np = None
+
+try:
+    import uvloop
+except ImportError:  # Keep the default asyncio event loop
+    uvloop = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Room for a full pipelined burst in the kernel (the default pipe-max-size)
+_PIPE_BUFFER_SIZE = 1 << 20
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# Context ID patterns (base64): "id": "abc123==" or ID: abc123==
+_ID_RE = re.compile(r'"id":\s*"([A-Za-z0-9+/=]+)"')
+_ID_RE_FALLBACK = re.compile(r'ID:\s*([A-Za-z0-9+/=]+)', re.IGNORECASE)
+
+# Test 2 fixtures, encoded once as store_context tools/call params
+TEST_CONTEXTS = [
+    {
+        "content": "Python async/await pattern for concurrent I/O operations",
+        "domain": "Code",
+        "tags": ["python", "async", "patterns"],
+        "importance": 0.8,
+        "source": "documentation"
+    },
+    {
+        "content": "The Rust ownership model prevents data races at compile time through the borrow checker",
+        "domain": "Documentation",
+        "tags": ["rust", "memory-safety", "ownership"],
+        "importance": 0.9,
+        "source": "rust-book"
+    },
+    {
+        "content": "Machine learning models require proper train/test split to avoid overfitting",
+        "domain": "Research",
+        "tags": ["ml", "validation", "best-practices"],
+        "importance": 0.7,
+        "source": "research-paper"
+    },
+    {
+        "content": "REST API design: use proper HTTP methods, status codes, and resource naming conventions",
+        "domain": "Code",
+        "tags": ["api", "rest", "design"],
+        "importance": 0.75,
+        "source": "api-guidelines"
+    },
+    {
+        "content": "Git rebase vs merge: rebase for clean history, merge for preserving context",
+        "domain": "General",
+        "tags": ["git", "version-control", "workflow"],
+        "importance": 0.6,
+        "source": "git-docs"
+    },
+]
+
+_TEST_CONTEXT_PARAMS = [
+    json_dumps({"name": "store_context", "arguments": ctx}) for ctx in TEST_CONTEXTS
+]
+
+def _extract_text(result: Dict) -> Optional[str]:
+    """Return the text of a tool result's first content item, or None if it is not text"""
+    content_list = result.get("content")
+    if content_list and content_list[0].get("type") == "text":
+        return content_list[0].get("text", "")
+    return None
+
+def _extract_id(result: Dict, text: str) -> Optional[str]:
+    """Return the context ID from a tool result, preferring structured content over text scanning"""
+    structured = result.get("structuredContent")
+    if isinstance(structured, dict) and isinstance(structured.get("id"), str):
+        return structured["id"]
+    
+    # Older servers only report the ID inside the text blob - base64 encoded
+    id_match = _ID_RE.search(text) or _ID_RE_FALLBACK.search(text)
+    return id_match.group(1) if id_match else None
+
+def _grow_stdio_pipes():
+    """Enlarge the stdin/stdout pipe buffers; runs in the server child before exec"""
+    for fd in (0, 1):
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            continue  # F_SETPIPE_SZ only applies to pipes
+        try:
+            fcntl.fcntl(fd, _F_SETPIPE_SZ, _PIPE_BUFFER_SIZE)
+        except OSError:
+            # Speed-only tuning (e.g. EPERM above /proc/sys/fs/pipe-max-size); an
+            # error raised here would abort the spawn and nothing can report it
+            pass
+
 class MCPClient:
     """Simple MCP client using stdio transport"""
     
+    _RPC_PREFIX = b'{"jsonrpc":"2.0","id":'
+    _FRAME_START = frozenset(b'{ \t\r')
+    _IOV_MAX = 1024  # Linux limit on buffers per writev(2) call
+    _RESPONSE_TIMEOUT = 30.0  # Seconds to wait for a reply before failing the call
+    
     def __init__(self, command: List[str]):
         self.process = None
         self.command = command
         self.request_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._rxbuf = bytearray()
+        self._method_parts: Dict[str, bytes] = {}
+        self._reader_task: Optional[asyncio.Task] = None
         
     async def start(self):
         """Start the MCP server process"""
+        # uvloop runs preexec_fn before it wires the child's stdio (which are
+        # socketpairs there, not pipes), so the pipe hook would resize our own stdio
+        on_uvloop = uvloop is not None and isinstance(asyncio.get_running_loop(), uvloop.Loop)
+        grow_pipes = fcntl is not None and sys.platform == "linux" and not on_uvloop
         self.process = await asyncio.create_subprocess_exec(
             *self.command,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE  # Capture stderr separately
+            stderr=subprocess.PIPE,  # Capture stderr separately
+            limit=1 << 20,  # Let pipelined responses queue without pausing the reader
+            # F_SETPIPE_SZ is Linux-only; resizing from the child reaches the stdout
+            # pipe, which has no public handle on the parent side
+            preexec_fn=_grow_stdio_pipes if grow_pipes else None
         )
+        # With no write buffering, drain() only returns once frames reach the pipe
+        self.process.stdin.transport.set_write_buffer_limits(0)
+        # Under uvloop stdin is a socketpair whose send buffer is ours to size. The
+        # stdout socket's send side belongs to the child and has no public handle,
+        # so it keeps the kernel default
+        stdin_sock = self.process.stdin.transport.get_extra_info("socket")
+        if stdin_sock is not None:
+            stdin_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _PIPE_BUFFER_SIZE)
+        self._reader_task = asyncio.create_task(self._read_responses())
         print(f"✓ Started MCP server: {' '.join(self.command)}")
         
         # Initialize connection
@@ -41,66 +183,226 @@ class MCPClient:
     async def stop(self):
         """Stop the MCP server process"""
         if self.process:
-            self.process.terminate()
+            # The server may already have exited (e.g. crashed mid-suite)
+            if self.process.returncode is None:
+                try:
+                    self.process.terminate()
+                except ProcessLookupError:
+                    pass
             await self.process.wait()
+            if self._reader_task:
+                await self._reader_task
             print("✓ Stopped MCP server")
     
-    async def call_method(self, method: str, params: Dict = None) -> Dict:
-        """Call an MCP method"""
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self.request_id,
-            "method": method,
-            "params": params or {}
-        }
-        
-        # Send request
-        request_str = json.dumps(request) + "\n"
-        self.process.stdin.write(request_str.encode())
-        await self.process.stdin.drain()
-        
-        # Read response (skip any non-JSON lines)
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            response_line = await self.process.stdout.readline()
-            response_str = response_line.decode().strip()
-            
-            if not response_str:
-                continue
-                
-            try:
-                response = json.loads(response_str)
+    async def _read_responses(self):
+        """Split stdout into newline-delimited frames and route each response by request id"""
+        rxbuf = self._rxbuf
+        while True:
+            chunk = await self.process.stdout.read(65536)
+            if not chunk:
                 break
-            except json.JSONDecodeError:
-                # Skip non-JSON lines (like log messages)
-                if attempt == max_attempts - 1:
-                    raise Exception(f"Could not parse response after {max_attempts} attempts")
-                continue
+            rxbuf.extend(chunk)
+            
+            # Parse complete frames in place, then drop them from the buffer in one go
+            start = 0
+            with memoryview(rxbuf) as view:
+                while (end := rxbuf.find(b"\n", start)) != -1:
+                    with view[start:end] as frame:
+                        self._dispatch(frame)
+                    start = end + 1
+            del rxbuf[:start]
+        
+        # Server closed stdout: fail anything still waiting for a reply
+        self._fail_pending(Exception("MCP server closed stdout"))
+    
+    def _fail_pending(self, error: Exception):
+        """Fail every in-flight request with the given error"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+    
+    def _dispatch(self, frame: memoryview):
+        """Resolve the pending future matching a single response frame"""
+        # Blank lines and log output never start like a response object; skip
+        # them without paying for a failed parse
+        if not frame or frame[0] not in self._FRAME_START:
+            return
+        
+        try:
+            response = json_loads(frame)
+        except ValueError:
+            # Skip non-JSON lines (like log messages)
+            return
         
+        if not isinstance(response, dict):
+            return
+        request_id = response.get("id")
+        try:
+            future = self._pending.pop(request_id, None)
+        except TypeError:
+            # A list or dict id can never match one of our requests
+            future = None
+        
+        if future is None:
+            # The server reports requests it could not parse with id 0 (or null);
+            # there is no way to tell which request failed, so fail them all
+            # rather than leave the callers waiting. Any other unknown id (e.g. a
+            # late reply to a request that already timed out) is dropped
+            if "error" in response and (request_id is None or request_id == 0):
+                self._fail_pending(Exception(f"MCP error: {response['error']}"))
+            return
+        if not future.done():
+            future.set_result(response)
+    
+    async def _await_response(self, awaitable, request_ids: List[int]):
+        """Wait for response(s), failing the call if the server never answers"""
+        try:
+            return await asyncio.wait_for(awaitable, self._RESPONSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+            raise Exception(
+                f"No response to request(s) {request_ids} within {self._RESPONSE_TIMEOUT:.0f}s"
+            ) from None
+    
+    def _prepare(self, method: str, encoded_params: bytes):
+        """Frame already-encoded params and register the future for the response; returns (id, frame, future)"""
+        self.request_id += 1
+        request_id = self.request_id
+        method_part = self._method_parts.get(method)
+        if method_part is None:
+            method_part = b',"method":' + json_dumps(method) + b',"params":'
+            self._method_parts[method] = method_part
+        
+        # Only the id and params vary between requests; the envelope is a fixed template
+        frame = b"".join((
+            self._RPC_PREFIX,
+            str(request_id).encode(),
+            method_part,
+            encoded_params,
+            b"}\n"
+        ))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        return request_id, frame, future
+    
+    @staticmethod
+    def _unwrap(response: Dict, expect_result: bool = True) -> Optional[Dict]:
+        """Return the result of a JSON-RPC response, raising on errors"""
         if "error" in response:
             raise Exception(f"MCP error: {response['error']}")
+        if not expect_result:
+            return None
             
         return response.get("result", {})
     
-    async def call_tool(self, tool_name: str, arguments: Dict = None) -> Dict:
+    def _write_frames(self, frames: List[bytes]):
+        """Write frames to stdin with a single writev(2) when the transport has nothing queued"""
+        transport = self.process.stdin.transport
+        pipe = transport.get_extra_info("pipe")
+        if (pipe is None or not hasattr(os, "writev") or len(frames) > self._IOV_MAX
+                or transport.is_closing() or transport.get_write_buffer_size()):
+            self.process.stdin.write(b"".join(frames))
+            return
+        
+        try:
+            sent = os.writev(pipe.fileno(), frames)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        
+        # Queue whatever the pipe did not accept on the transport, preserving order
+        for i, frame in enumerate(frames):
+            if sent < len(frame):
+                self.process.stdin.write(b"".join([frame[sent:], *frames[i + 1:]]))
+                return
+            sent -= len(frame)
+    
+    async def call_method(self, method: str, params: Dict = None,
+                          expect_result: bool = True) -> Optional[Dict]:
+        """Call an MCP method; with expect_result=False only errors are checked"""
+        if self._reader_task.done():
+            raise Exception("MCP server closed stdout")
+        request_id, frame, future = self._prepare(method, json_dumps(params or {}))
+        
+        # Send request; the reader task resolves the future by id
+        self.process.stdin.write(frame)
+        await self.process.stdin.drain()
+        response = await self._await_response(future, [request_id])
+        return self._unwrap(response, expect_result)
+    
+    async def call_tool(self, tool_name: str, arguments: Dict = None,
+                        expect_result: bool = True) -> Optional[Dict]:
         """Call an MCP tool"""
         result = await self.call_method("tools/call", {
             "name": tool_name,
             "arguments": arguments or {}
-        })
+        }, expect_result)
         return result
+    
+    async def call_tool_batch(self, tool_name: str, args_list: List[Dict],
+                              expect_result: bool = True) -> Optional[List[Dict]]:
+        """Call an MCP tool once per argument set, sending all requests in a single write"""
+        return await self.call_batch("tools/call", [
+            json_dumps({"name": tool_name, "arguments": arguments or {}})
+            for arguments in args_list
+        ], expect_result)
+    
+    async def call_batch(self, method: str, encoded_params: List[bytes],
+                         expect_result: bool = True) -> Optional[List[Dict]]:
+        """Call an MCP method once per pre-encoded params, sending all requests in a single write"""
+        if self._reader_task.done():
+            raise Exception("MCP server closed stdout")
+        request_ids = []
+        frames = []
+        futures = []
+        for params in encoded_params:
+            request_id, frame, future = self._prepare(method, params)
+            request_ids.append(request_id)
+            frames.append(frame)
+            futures.append(future)
+        
+        self._write_frames(frames)
+        await self.process.stdin.drain()
+        responses = await self._await_response(
+            asyncio.gather(*futures), request_ids
+        )
+        if not expect_result:
+            for response in responses:
+                self._unwrap(response, expect_result=False)
+            return None
+        return [self._unwrap(response) for response in responses]
+
+@dataclass(slots=True)
+class BenchStat:
+    """Summary statistics for one benchmarked operation"""
+    min: float
+    max: float
+    mean: float
+    median: float
+    stdev: float
+    samples: int
+    unit: str
 
 class TestResults:
     """Store and format test results"""
     
+    # Parsed once; rows only substitute values into the bound format
+    _BENCH_ROW = ("  {op:<25} "
+                  "{s.mean:.2f}{s.unit:<8} "
+                  "{s.median:.2f}{s.unit:<8} "
+                  "{s.min:.2f}{s.unit:<8} "
+                  "{s.max:.2f}{s.unit:<8} "
+                  "{s.stdev:.2f}{s.unit:<6}").format
+    
     def __init__(self):
         self.tests_passed = 0
         self.tests_failed = 0
         self.errors = []
-        self.benchmarks = {}
+        self.benchmarks: Dict[str, BenchStat] = {}
+        self._bench_rows: Dict[str, str] = {}
         self.metrics = {}
-        self.stored_ids = []
+        self.stored_ids = deque()
         
     def add_success(self, test_name: str):
         self.tests_passed += 1
@@ -112,67 +414,78 @@ class TestResults:
         print(f"  ✗ {test_name}: {error}")
         
     def add_benchmark(self, operation: str, timings: List[float], unit: str = "ms"):
-        self.benchmarks[operation] = {
-            "min": min(timings),
-            "max": max(timings),
-            "mean": statistics.mean(timings),
-            "median": statistics.median(timings),
-            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0,
-            "samples": len(timings),
-            "unit": unit
-        }
+        if np is not None:
+            # One vectorized pass per statistic instead of Python-level iteration
+            arr = np.asarray(timings, dtype=np.float64)
+            stat = BenchStat(
+                min=float(arr.min()),
+                max=float(arr.max()),
+                mean=float(arr.mean()),
+                median=float(np.median(arr)),
+                stdev=float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
+                samples=int(arr.size),
+                unit=unit
+            )
+        else:
+            stat = BenchStat(
+                min=min(timings),
+                max=max(timings),
+                mean=statistics.mean(timings),
+                median=statistics.median(timings),
+                stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                samples=len(timings),
+                unit=unit
+            )
+        self.benchmarks[operation] = stat
+        # Render the report row once, when the numbers are final
+        self._bench_rows[operation] = self._BENCH_ROW(op=operation, s=stat)
         
     def add_metric(self, name: str, value: Any, unit: str = ""):
         self.metrics[name] = {"value": value, "unit": unit}
         
     def print_report(self):
         """Print comprehensive assessment report"""
-        print("\n" + "="*80)
-        print(" CONTEXT-MCP SERVER ASSESSMENT REPORT")
-        print("="*80)
-        print(f"\nTest Execution: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # Assemble the whole report and emit it with a single write
+        out = [
+            "\n" + "="*80,
+            " CONTEXT-MCP SERVER ASSESSMENT REPORT",
+            "="*80,
+            f"\nTest Execution: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
         
         # Test Summary
-        print(f"\n{'TEST SUMMARY':-^80}")
+        out.append(f"\n{'TEST SUMMARY':-^80}")
         total = self.tests_passed + self.tests_failed
-        if total > 0:
-            print(f"  Total Tests: {total}")
-            print(f"  Passed: {self.tests_passed} ({self.tests_passed/total*100:.1f}%)")
-            print(f"  Failed: {self.tests_failed} ({self.tests_failed/total*100:.1f}%)")
-        else:
-            print(f"  No tests were executed")
+        if total == 0:
+            out.append("  No tests were executed")
+            sys.stdout.write("\n".join(out) + "\n")
             return
+        out.append(f"  Total Tests: {total}")
+        out.append(f"  Passed: {self.tests_passed} ({self.tests_passed/total*100:.1f}%)")
+        out.append(f"  Failed: {self.tests_failed} ({self.tests_failed/total*100:.1f}%)")
         
         if self.errors:
-            print(f"\n{'ERRORS':-^80}")
-            for error in self.errors:
-                print(f"  • {error}")
+            out.append(f"\n{'ERRORS':-^80}")
+            out.extend(f"  • {error}" for error in self.errors)
         
         # Performance Benchmarks
-        print(f"\n{'PERFORMANCE BENCHMARKS':-^80}")
-        print(f"  {'Operation':<25} {'Mean':<12} {'Median':<12} {'Min':<12} {'Max':<12} {'StdDev':<10}")
-        print(f"  {'-'*25} {'-'*12} {'-'*12} {'-'*12} {'-'*12} {'-'*10}")
-        
-        for op, stats in self.benchmarks.items():
-            unit = stats['unit']
-            print(f"  {op:<25} "
-                  f"{stats['mean']:.2f}{unit:<8} "
-                  f"{stats['median']:.2f}{unit:<8} "
-                  f"{stats['min']:.2f}{unit:<8} "
-                  f"{stats['max']:.2f}{unit:<8} "
-                  f"{stats['stdev']:.2f}{unit:<6}")
+        out.append(f"\n{'PERFORMANCE BENCHMARKS':-^80}")
+        out.append(f"  {'Operation':<25} {'Mean':<12} {'Median':<12} {'Min':<12} {'Max':<12} {'StdDev':<10}")
+        out.append(f"  {'-'*25} {'-'*12} {'-'*12} {'-'*12} {'-'*12} {'-'*10}")
+        out.extend(self._bench_rows.values())
         
         # Key Metrics
-        print(f"\n{'KEY METRICS':-^80}")
+        out.append(f"\n{'KEY METRICS':-^80}")
         for name, data in self.metrics.items():
             value = data['value']
             unit = data['unit']
             if isinstance(value, float):
-                print(f"  {name}: {value:.2f} {unit}")
+                out.append(f"  {name}: {value:.2f} {unit}")
             else:
-                print(f"  {name}: {value} {unit}")
+                out.append(f"  {name}: {value} {unit}")
         
-        print("\n" + "="*80)
+        out.append("\n" + "="*80)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 async def run_test_suite():
@@ -187,10 +500,10 @@ async def run_test_suite():
         
         # Test 1: List available tools
         print("\n[1] Testing Tool Discovery")
-        start = time.time()
+        start = time.perf_counter_ns()
         tools_result = await client.call_method("tools/list")
         tools = tools_result.get("tools", [])
-        results.add_metric("Tool Discovery Time", (time.time() - start) * 1000, "ms")
+        results.add_metric("Tool Discovery Time", (time.perf_counter_ns() - start) / 1_000_000, "ms")
         results.add_metric("Available Tools", len(tools))
         
         if len(tools) == 9:
@@ -201,63 +514,15 @@ async def run_test_suite():
         
         # Test 2: Store contexts with diverse content
         print("\n[2] Testing Storage Operations")
-        test_contexts = [
-            {
-                "content": "Python async/await pattern for concurrent I/O operations",
-                "domain": "Code",
-                "tags": ["python", "async", "patterns"],
-                "importance": 0.8,
-                "source": "documentation"
-            },
-            {
-                "content": "The Rust ownership model prevents data races at compile time through the borrow checker",
-                "domain": "Documentation",
-                "tags": ["rust", "memory-safety", "ownership"],
-                "importance": 0.9,
-                "source": "rust-book"
-            },
-            {
-                "content": "Machine learning models require proper train/test split to avoid overfitting",
-                "domain": "Research",
-                "tags": ["ml", "validation", "best-practices"],
-                "importance": 0.7,
-                "source": "research-paper"
-            },
-            {
-                "content": "REST API design: use proper HTTP methods, status codes, and resource naming conventions",
-                "domain": "Code",
-                "tags": ["api", "rest", "design"],
-                "importance": 0.75,
-                "source": "api-guidelines"
-            },
-            {
-                "content": "Git rebase vs merge: rebase for clean history, merge for preserving context",
-                "domain": "General",
-                "tags": ["git", "version-control", "workflow"],
-                "importance": 0.6,
-                "source": "git-docs"
-            },
-        ]
-        
-        store_timings = []
-        for i, ctx in enumerate(test_contexts):
-            start = time.time()
-            result = await client.call_tool("store_context", ctx)
-            elapsed = (time.time() - start) * 1000
-            store_timings.append(elapsed)
-            
-            content = result.get("content", [{}])[0]
-            if content.get("type") == "text":
-                text = content.get("text", "")
-                # Extract ID from response - base64 encoded
-                import re
-                # Pattern for base64 ID: "id": "abc123==" or ID: abc123==
-                id_match = re.search(r'"id":\s*"([A-Za-z0-9+/=]+)"', text)
-                if not id_match:
-                    id_match = re.search(r'ID:\s*([A-Za-z0-9+/=]+)', text, re.IGNORECASE)
-                
-                if id_match:
-                    ctx_id = id_match.group(1)
+        start = time.perf_counter_ns()
+        store_batch = await client.call_batch("tools/call", _TEST_CONTEXT_PARAMS)
+        elapsed = (time.perf_counter_ns() - start) / 1_000_000
+        
+        for i, result in enumerate(store_batch):
+            text = _extract_text(result)
+            if text is not None:
+                ctx_id = _extract_id(result, text)
+                if ctx_id:
                     results.stored_ids.append(ctx_id)
                     results.add_success(f"Store context #{i+1} (ID: {ctx_id[:8]}...)")
                 else:
@@ -266,21 +531,22 @@ async def run_test_suite():
             else:
                 results.add_failure(f"Store context #{i+1}", "Invalid response format")
         
-        results.add_benchmark("Store Context", store_timings)
-        results.add_metric("Contexts Stored", len(test_contexts))
+        # The server handles the pipelined stores one line at a time, so per-reply
+        # times would mostly reflect queue position; report the amortized cost only
+        results.add_metric("Store Context (amortized)", elapsed / len(TEST_CONTEXTS), "ms")
+        results.add_metric("Contexts Stored", len(TEST_CONTEXTS))
         
         # Test 3: Retrieve stored contexts
         print("\n[3] Testing Retrieval Operations")
         if results.stored_ids:
             retrieve_timings = []
-            for i, ctx_id in enumerate(results.stored_ids[:3]):  # Test first 3
-                start = time.time()
+            for i, ctx_id in enumerate(itertools.islice(results.stored_ids, 3)):  # Test first 3
+                start = time.perf_counter_ns()
                 result = await client.call_tool("get_context", {"id": ctx_id})
-                elapsed = (time.time() - start) * 1000
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000
                 retrieve_timings.append(elapsed)
                 
-                content = result.get("content", [{}])[0]
-                if content.get("type") == "text":
+                if _extract_text(result) is not None:
                     results.add_success(f"Retrieve context #{i+1}")
                 else:
                     results.add_failure(f"Retrieve context #{i+1}", "Invalid response")
@@ -299,14 +565,13 @@ async def run_test_suite():
         query_timings = []
         for query_test in query_tests:
             test_name = query_test.pop("test_name")
-            start = time.time()
+            start = time.perf_counter_ns()
             result = await client.call_tool("query_contexts", query_test)
-            elapsed = (time.time() - start) * 1000
+            elapsed = (time.perf_counter_ns() - start) / 1_000_000
             query_timings.append(elapsed)
             
-            content = result.get("content", [{}])[0]
-            if content.get("type") == "text":
-                text = content.get("text", "")
+            text = _extract_text(result)
+            if text is not None:
                 # Check if we got results
                 if "found" in text.lower() or "contexts" in text.lower():
                     results.add_success(test_name)
@@ -327,75 +592,72 @@ async def run_test_suite():
         
         rag_timings = []
         for i, query in enumerate(rag_queries):
-            start = time.time()
+            start = time.perf_counter_ns()
             result = await client.call_tool("retrieve_contexts", query)
-            elapsed = (time.time() - start) * 1000
+            elapsed = (time.perf_counter_ns() - start) / 1_000_000
             rag_timings.append(elapsed)
             
-            content = result.get("content", [{}])[0]
-            if content.get("type") == "text":
+            if _extract_text(result) is not None:
                 results.add_success(f"RAG query #{i+1}")
             else:
                 results.add_failure(f"RAG query #{i+1}", "Invalid response")
         
         results.add_benchmark("RAG Retrieval", rag_timings)
         
+        # Tests 6-9 have no data dependencies, so issue them concurrently and
+        # validate the responses afterwards. The server still handles them one
+        # at a time, so only the block's wall time is meaningful, not per-call
+        # timings (each would include the time queued behind the others)
+        stats_calls = [
+            client.call_tool("get_storage_stats", {}),
+            client.call_tool("get_temporal_stats", {}),
+            client.call_tool("cleanup_expired", {}),
+        ]
+        start = time.perf_counter_ns()
+        if results.stored_ids:
+            screening, *stats = await asyncio.gather(
+                client.call_tool("update_screening", {
+                    "id": results.stored_ids[0],
+                    "status": "Safe",
+                    "reason": "Automated test verification"
+                }),
+                *stats_calls
+            )
+        else:
+            screening = None
+            stats = await asyncio.gather(*stats_calls)
+        results.add_metric("Status/Stats Calls (concurrent wall time)",
+                           (time.perf_counter_ns() - start) / 1_000_000, "ms")
+        storage, temporal, cleanup = stats
+        
         # Test 6: Screening status update
         print("\n[6] Testing Screening Status")
-        if results.stored_ids:
-            start = time.time()
-            result = await client.call_tool("update_screening", {
-                "id": results.stored_ids[0],
-                "status": "Safe",
-                "reason": "Automated test verification"
-            })
-            elapsed = (time.time() - start) * 1000
-            
-            content = result.get("content", [{}])[0]
-            if content.get("type") == "text":
+        if screening is not None:
+            if _extract_text(screening) is not None:
                 results.add_success("Update screening status")
-                results.add_benchmark("Update Screening", [elapsed])
             else:
                 results.add_failure("Update screening status", "Invalid response")
         
         # Test 7: Storage statistics
         print("\n[7] Testing Storage Statistics")
-        start = time.time()
-        result = await client.call_tool("get_storage_stats", {})
-        elapsed = (time.time() - start) * 1000
-        
-        content = result.get("content", [{}])[0]
-        if content.get("type") == "text":
-            text = content.get("text", "")
+        text = _extract_text(storage)
+        if text is not None:
             results.add_success("Get storage stats")
-            results.add_benchmark("Get Storage Stats", [elapsed])
             print(f"    {text[:200]}...")
         else:
             results.add_failure("Get storage stats", "Invalid response")
         
         # Test 8: Temporal statistics
         print("\n[8] Testing Temporal Statistics")
-        start = time.time()
-        result = await client.call_tool("get_temporal_stats", {})
-        elapsed = (time.time() - start) * 1000
-        
-        content = result.get("content", [{}])[0]
-        if content.get("type") == "text":
+        if _extract_text(temporal) is not None:
             results.add_success("Get temporal stats")
-            results.add_benchmark("Get Temporal Stats", [elapsed])
         else:
             results.add_failure("Get temporal stats", "Invalid response")
         
         # Test 9: Cleanup expired
         print("\n[9] Testing Cleanup Operations")
-        start = time.time()
-        result = await client.call_tool("cleanup_expired", {})
-        elapsed = (time.time() - start) * 1000
-        
-        content = result.get("content", [{}])[0]
-        if content.get("type") == "text":
+        if _extract_text(cleanup) is not None:
             results.add_success("Cleanup expired contexts")
-            results.add_benchmark("Cleanup Expired", [elapsed])
         else:
             results.add_failure("Cleanup expired", "Invalid response")
         
@@ -403,14 +665,13 @@ async def run_test_suite():
         print("\n[10] Testing Delete Operations")
         if results.stored_ids and len(results.stored_ids) > 0:
             delete_timings = []
-            for i, ctx_id in enumerate(results.stored_ids[:2]):  # Delete first 2
-                start = time.time()
+            for i, ctx_id in enumerate(itertools.islice(results.stored_ids, 2)):  # Delete first 2
+                start = time.perf_counter_ns()
                 result = await client.call_tool("delete_context", {"id": ctx_id})
-                elapsed = (time.time() - start) * 1000
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000
                 delete_timings.append(elapsed)
                 
-                content = result.get("content", [{}])[0]
-                if content.get("type") == "text":
+                if _extract_text(result) is not None:
                     results.add_success(f"Delete context #{i+1}")
                 else:
                     results.add_failure(f"Delete context #{i+1}", "Invalid response")
@@ -421,25 +682,29 @@ async def run_test_suite():
         print("\n[11] Testing Throughput")
         num_ops = 50
         print(f"    Performing {num_ops} rapid store operations...")
-        throughput_start = time.time()
+        throughput_start = time.perf_counter_ns()
         
-        for i in range(num_ops):
-            await client.call_tool("store_context", {
+        # Submit every request in one write so the server sees them pipelined
+        await client.call_tool_batch("store_context", [
+            {
                 "content": f"Throughput test content item {i}",
                 "domain": "General",
                 "importance": 0.5
-            })
+            }
+            for i in range(num_ops)
+        ], expect_result=False)
         
-        throughput_elapsed = time.time() - throughput_start
+        throughput_elapsed = (time.perf_counter_ns() - throughput_start) / 1_000_000_000
         ops_per_sec = num_ops / throughput_elapsed
         results.add_metric("Store Throughput", ops_per_sec, "ops/sec")
-        results.add_metric("Store Latency (avg)", (throughput_elapsed / num_ops) * 1000, "ms")
+        results.add_metric("Store Time (amortized)", (throughput_elapsed / num_ops) * 1000, "ms")
         results.add_success(f"Throughput test ({num_ops} operations)")
         
     except Exception as e:
         print(f"\n✗ Fatal error: {e}")
-        import traceback
         traceback.print_exc()
+        # A lost or unroutable reply aborts the suite; make sure it is reported as a failure
+        results.add_failure("Test suite aborted", str(e))
     finally:
         await client.stop()
     
@@ -449,5 +714,13 @@ async def run_test_suite():
     return results.tests_failed == 0
 
 if __name__ == "__main__":
-    success = asyncio.run(run_test_suite())
+    # libuv-backed pipe transports cut per-message dispatch overhead
+    if uvloop is None:
+        success = asyncio.run(run_test_suite())
+    elif sys.version_info >= (3, 12):
+        success = asyncio.run(run_test_suite(), loop_factory=uvloop.new_event_loop)
+    else:
+        # No loop_factory before 3.12; the (deprecated) policy API is the only hook
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        success = asyncio.run(run_test_suite())
     sys.exit(0 if success else 1)